@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.utils import timezone
 from django.utils.html import format_html
 from django.db.models import Count
 from .models import User, EmailVerificationToken
@@ -14,6 +15,7 @@ class UserAdmin(BaseUserAdmin):
     search_fields = ('email', 'first_name', 'last_name')
     ordering = ('-created_at',)
     readonly_fields = ('created_at', 'updated_at', 'last_login')
+    list_select_related = ()
 
     fieldsets = (
         (None, {'fields': ('email', 'password')}),
@@ -36,20 +38,17 @@ class UserAdmin(BaseUserAdmin):
         return  format_html('<span style="color: red;">●</span> Offline')
     is_online_status.short_description = 'Status'
 
-    def get_queryset(self, request):
-        return super().get_queryset(request).select_related()
-    
     actions = ['make_active', 'make_inactive']
 
     def make_active(self, request, queryset):
-        updated = queryset.updated(is_active=True)
+        updated = queryset.update(is_active=True, updated_at=timezone.now())
         self.message_user(request, f"{updated} Users marked as active ")
     make_active.short_description = "Mark selected users as Active"
 
     def make_inactive(self, request, queryset):
-        updated = queryset.updated(is_active=False)
+        updated = queryset.update(is_active=False, updated_at=timezone.now())
         self.message_user(request, f"{updated} Users marked as inactive ")
-    make_active.short_description = "Mark selected users as Inactive"
+    make_inactive.short_description = "Mark selected users as Inactive"
 
 
 @admin.register(EmailVerificationToken)
@@ -58,18 +57,26 @@ class EmailVerificationTokenAdmin(admin.ModelAdmin):
     list_filter  = ('is_used', 'created_at')
     search_fields = ('user__email', 'user__first_name', 'user__last_name')
     ordering = ('-created_at',)
-    readonly_fields = ('token', 'created_at', 'is_expired_status')
+    readonly_fields = ('token_hex', 'created_at', 'is_expired_status')
+    list_select_related = ('user',)
 
     def token_preview(self, obj:EmailVerificationToken):
-        return f"{str(obj.token)[:8]}..."
+        return f"{bytes(obj.token).hex()[:8]}..."
     token_preview.short_description = "Token Preview"
 
+    def token_hex(self, obj:EmailVerificationToken):
+        return bytes(obj.token).hex()
+    token_hex.short_description = "Token"
+
     def is_expired_status(self, obj:EmailVerificationToken):
         if obj.is_expired():
             return format_html('<span style="color: red;">Expired</span> ')
         return  format_html('<span style="color: green;">Valid</span>')
     is_expired_status.short_description = 'Status'
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user')
+
     actions = ['mark_tokens_used']
 
     def mark_tokens_used(self, request, queryset):
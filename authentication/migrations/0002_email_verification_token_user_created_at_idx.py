@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emailverificationtoken',
+            index=models.Index(fields=['user', 'created_at'], name='email_verif_user_id_c77bd5_idx'),
+        ),
+    ]
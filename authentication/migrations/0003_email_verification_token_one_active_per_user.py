@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:39
+
+from django.db import migrations, models
+
+
+def retire_duplicate_active_tokens(apps, schema_editor):
+    EmailVerificationToken = apps.get_model('authentication', 'EmailVerificationToken')
+    active = EmailVerificationToken.objects.filter(is_used=False).order_by('user_id', '-created_at', '-id')
+
+    seen, stale = set(), []
+    for token_id, user_id in active.values_list('id', 'user_id'):
+        if user_id in seen:
+            stale.append(token_id)
+        seen.add(user_id)
+
+    EmailVerificationToken.objects.filter(id__in=stale).update(is_used=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0002_email_verification_token_user_created_at_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(retire_duplicate_active_tokens, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='emailverificationtoken',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_used', False)), fields=('user',), name='one_active_token_per_user'),
+        ),
+    ]
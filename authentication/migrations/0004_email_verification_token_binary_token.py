@@ -0,0 +1,46 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:40
+
+import authentication.models
+from django.db import migrations, models
+
+
+def copy_uuid_tokens(apps, schema_editor):
+    EmailVerificationToken = apps.get_model('authentication', 'EmailVerificationToken')
+    tokens = list(EmailVerificationToken.objects.only('id', 'token'))
+    for verification_token in tokens:
+        verification_token.token_bytes = verification_token.token.bytes
+    EmailVerificationToken.objects.bulk_update(tokens, ['token_bytes'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0003_email_verification_token_one_active_per_user'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='emailverificationtoken',
+            name='email_verif_token_df7c5e_idx',
+        ),
+        migrations.AddField(
+            model_name='emailverificationtoken',
+            name='token_bytes',
+            field=models.BinaryField(null=True),
+        ),
+        migrations.RunPython(copy_uuid_tokens, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='emailverificationtoken',
+            name='token',
+        ),
+        migrations.RenameField(
+            model_name='emailverificationtoken',
+            old_name='token_bytes',
+            new_name='token',
+        ),
+        migrations.AlterField(
+            model_name='emailverificationtoken',
+            name='token',
+            field=models.BinaryField(default=authentication.models.generate_token, unique=True),
+        ),
+    ]
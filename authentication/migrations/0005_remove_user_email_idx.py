@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:41
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0004_email_verification_token_binary_token'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='users_email_4b85f2_idx',
+        ),
+    ]
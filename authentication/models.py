@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.contrib.auth.models import (
     AbstractBaseUser,
     BaseUserManager,
@@ -6,7 +6,9 @@ from django.contrib.auth.models import (
 )
 from django.utils import timezone
 from django.core.validators import RegexValidator
-import uuid
+import secrets
+
+EMAIL_VERIFICATION_TOKEN_LIFETIME = timezone.timedelta(hours=24)
 
 
 class UserManager(BaseUserManager):
@@ -70,42 +72,67 @@ class User(AbstractBaseUser, PermissionsMixin):
         """Mark user email as verified"""
         self.is_verified = True
         self.email_verified_at = timezone.now()
-        self.save(update_fields=["is_verified", "email_verified_at"])
+        self.save(update_fields=["is_verified", "email_verified_at", "updated_at"])
 
     def update_online_status(self, is_online=True):
         """Update user online field"""
         self.is_online = is_online
         self.last_seen = timezone.now()
-        self.save(update_fields=["is_online", "last_seen"])
+        self.save(update_fields=["is_online", "last_seen", "updated_at"])
 
     class Meta:
         db_table = "users"
         indexes = [
             models.Index(fields=["role", "is_active"]),
-            models.Index(fields=["email"]),
             models.Index(fields=["is_online"]),
         ]
 
 
+def generate_token():
+    """128-bit random token, hex-encoded only when rendered into a URL"""
+    return secrets.token_bytes(16)
+
+
+class EmailVerificationTokenManager(models.Manager):
+    def rotate(self, user):
+        """Issue a new token, retiring the user's active one only if it exists"""
+        try:
+            with transaction.atomic(using=self.db):
+                return self.create(user=user)
+        except IntegrityError:
+            with transaction.atomic(using=self.db):
+                self.filter(user=user, is_used=False).update(is_used=True)
+                return self.create(user=user)
+
+
 class EmailVerificationToken(models.Model):
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="verification_tokens"
     )
-    token = models.UUIDField(default=uuid.uuid4, unique=True)
+    token = models.BinaryField(default=generate_token, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
     expires_at = models.DateTimeField()
     is_used = models.BooleanField(default=False)
 
+    objects = EmailVerificationTokenManager()
+
     class Meta:
         db_table = "email_verification_tokens"
         indexes = [
-            models.Index(fields=["token"]),
             models.Index(fields=["user", "is_used"]),
+            models.Index(fields=["user", "created_at"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user"],
+                condition=models.Q(is_used=False),
+                name="one_active_token_per_user",
+            )
         ]
 
     def save(self, *args, **kwargs):
         if not self.expires_at:
-            self.expires_at = timezone.now() + timezone.timedelta(hours=24)
+            self.expires_at = timezone.now() + EMAIL_VERIFICATION_TOKEN_LIFETIME
         super().save(*args, **kwargs)
 
     def is_expired(self):
@@ -23,16 +23,13 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
 class UserSerializer(serializers.ModelSerializer):
     full_name = serializers.ReadOnlyField()
-    has_verified_email = serializers.SerializerMethodField()
-
-    def get_has_verified_email(self, obj):
-        return obj.is_verified
+    has_verified_email = serializers.BooleanField(source="is_verified", read_only=True)
 
     class Meta:
         model = User
         fields = [
             "id", "email", "first_name", "last_name", "full_name", "role",
-            "is_online", "last_seen", "is_active", "is_verified", "hase_verified_email",
+            "is_online", "last_seen", "is_active", "is_verified", "has_verified_email",
             "email_verified_at", "created_at", "updated_at",
         ] # fmt: skip
 
@@ -43,7 +40,7 @@ class UserLoginSerializer(serializers.Serializer):
 
 
 class EmailVerificationSerializer(serializers.Serializer):
-    token = serializers.UUIDField()
+    token = serializers.CharField(min_length=32, max_length=36)
 
 
 class ResendVerificationSerializer(serializers.Serializer):
@@ -1,69 +1,160 @@
 from django.utils import timezone
+from django.utils.crypto import salted_hmac
 from django.conf import settings
 from django.core.cache import cache
-from django.core.mail import send_mail
+from django.db import IntegrityError, transaction
+from django.core import mail
+from django.core.mail import EmailMultiAlternatives
 from django.contrib.auth import authenticate
-from django.template.loader import render_to_string
+from django.template.loader import get_template
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError, InvalidToken
 from .models import User, EmailVerificationToken
-from consultants.models import ConsultantProfile
+from .serializers import UserSerializer
+from .tasks import buffer_user_status, queue_verification_email
+from datetime import datetime
+from functools import lru_cache
+import smtplib
+import threading
 import uuid
 import logging
 
 logger = logging.getLogger(__name__)
 
+# skip the status UPDATE when the cached status is unchanged and this fresh
+USER_STATUS_WRITE_INTERVAL = timezone.timedelta(seconds=30)
+USER_SERIALIZER_CACHE_TIMEOUT = 60
+
+# user columns read by UserSerializer, for narrowing user queries with only()
+USER_PAYLOAD_FIELDS = (
+    "id", "email", "first_name", "last_name", "role", "is_online", "last_seen",
+    "is_active", "is_verified", "email_verified_at", "created_at", "updated_at",
+) # fmt: skip
+
+# failed logins are remembered briefly, and rejected outright past the limit
+AUTH_FAILURE_TIMEOUT = 30
+AUTH_FAILURE_LIMIT = 5
+
+
+@lru_cache(maxsize=None)
+def verification_email_template():
+    """Loaded and compiled once per process"""
+    return get_template("email/email_verification.html")
+
+
+_mail_connection = None
+_mail_connection_lock = threading.Lock()
+
+
+def mail_connection():
+    """Process-wide mail connection, opened once and reused across sends"""
+    global _mail_connection
+
+    with _mail_connection_lock:
+        if _mail_connection is None:
+            _mail_connection = mail.get_connection(fail_silently=False)
+            _mail_connection.open()
+        return _mail_connection
+
+
+def send_mail_messages(messages):
+    """Send over the shared connection, reconnecting once if the server dropped it"""
+    connection = mail_connection()
+    try:
+        return connection.send_messages(messages)
+    except smtplib.SMTPServerDisconnected:
+        with _mail_connection_lock:
+            connection.close()
+            connection.open()
+        return connection.send_messages(messages)
+
 
 class AuthenticationService:
 
     @staticmethod
     def register_user(email, password, first_name, last_name, role="patient"):
         try:
-            if User.objects.filter(email=email).exists():
-                return None, "User with this email already exists"
-
-            user = User.objects.create_user(
-                email=email, password=password,\
-                first_name=first_name, last_name=last_name,
-                role=role,
-            ) # fmt: skip
-
-            if role == "consultant":
-                ConsultantProfile.objects.create(user=user)
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    email=email, password=password,
+                    first_name=first_name, last_name=last_name,
+                    role=role,
+                ) # fmt: skip
 
             logger.info(f"User registered successfully: {email} with role {role}")
             return user, None
 
+        except IntegrityError:
+            return None, "User with this email already exists"
         except Exception as ex:
             logger.error(f"Registration failed for {email} : {str(ex)}")
             return None, str(ex)
 
     @staticmethod
     def authenticate_user(email, password):
+        digest = salted_hmac("authfail", password).hexdigest()[:16]
+        failure_key = f"authfail:{email}:{digest}"
+        failure_count_key = f"authfail:{email}"
+
+        if cache.get(failure_count_key, 0) >= AUTH_FAILURE_LIMIT:
+            logger.warning(f"Authentication throttled for : {email}")
+            return None, "Too many failed login attempts, please try again later"
+
+        if cache.get(failure_key):
+            return None, "Invalid Credentials"
+
         if user := authenticate(email=email, password=password):
             if not user.is_active:
                 return None, "User accont is deactivated"
 
-            refresh = RefreshToken.for_user(user)
+            cache.delete(failure_count_key)
+
+            access_token, refresh_token = AuthenticationService.issue_tokens(user)
             user.last_seen = timezone.now()
             logger.info(f"User authenticated successfully: {user.email}")
             return {
                 "user": user,
-                "access_token": str(refresh.access_token),
-                "refresh_token": str(refresh),
+                "access_token": access_token,
+                "refresh_token": refresh_token,
             }, None
         else:
+            cache.set(failure_key, True, timeout=AUTH_FAILURE_TIMEOUT)
+            cache.add(failure_count_key, 0, timeout=AUTH_FAILURE_TIMEOUT)
+            cache.incr(failure_count_key)
+
             logger.warning(f"Authentication failed for : {email}")
             return None, "Invalid Credentials"
 
+    @staticmethod
+    def issue_tokens(user):
+        """Issue an access/refresh pair for an already resolved user"""
+        refresh = RefreshToken.for_user(user)
+        return str(refresh.access_token), str(refresh)
+
+    @staticmethod
+    def serialize_user(user):
+        """Serialized user payload, cached until the row's updated_at changes"""
+        cache_key = f"user_ser_{user.id}_{user.updated_at.timestamp()}"
+        if (data := cache.get(cache_key)) is None:
+            data = dict(UserSerializer(user).data)
+            cache.set(cache_key, data, timeout=USER_SERIALIZER_CACHE_TIMEOUT)
+        return data
+
     @staticmethod
     def update_user_status(user, is_online=True):
         try:
+            now = timezone.now()
+            cache_key = f"user_status_{user.id}"
+            if (status := cache.get(cache_key)) and status["is_online"] == is_online:
+                last_seen = datetime.fromisoformat(status["last_seen"])
+                if now - last_seen < USER_STATUS_WRITE_INTERVAL:
+                    cache.touch(cache_key, timeout=3600)
+                    return
+
             user.is_online = is_online
-            user.last_seen = timezone.now()
-            user.save(update_fields=["is_online", "last_seen"])
+            user.last_seen = user.updated_at = now
+            buffer_user_status(user.pk, is_online, now)
 
-            cache_key = f"user_status_{user.id}"
             cache.set(
                 cache_key,
                 {"is_online": is_online, "last_seen": user.last_seen.isoformat()},
@@ -78,18 +169,15 @@ class AuthenticationService:
 class EmailVerificationService:
 
     @staticmethod
-    def send_verification_email(user: User):
+    def send_verification_email(user: User, verification_token=None):
         try:
-            EmailVerificationToken.objects.filter(user=user, is_used=False).update(
-                is_used=True
-            )
+            if verification_token is None:
+                verification_token = EmailVerificationToken.objects.rotate(user)
 
-            verification_token = EmailVerificationToken.objects.create(user=user)
             app_name = getattr(settings, "APP_NAME", "Godson Herbal Clinic App")
             subject = f"Verify your email - {app_name}"
-            verification_url = f"{getattr(settings, "FRONTEND_URL", 'http://localhost/3000')}/verify-email?token={verification_token.token}"
-            html_message = render_to_string(
-                "email/email_verification.html",
+            verification_url = f"{getattr(settings, "FRONTEND_URL", 'http://localhost/3000')}/verify-email?token={verification_token.token.hex()}"
+            html_message = verification_email_template().render(
                 {"user": user, "verification_url": verification_url, "app_name":app_name} # fmt: skip
             )
 
@@ -106,11 +194,13 @@ class EmailVerificationService:
                 {app_name} Team
             """
 
-            send_mail(
-                subject=subject, message=plain_message, html_message=html_message,
+            message = EmailMultiAlternatives(
+                subject=subject, body=plain_message,
                 from_email=getattr(settings, 'FROM_EMAIL', 'noreply@domain.com'),
-                recipient_list=[user.email], fail_silently=False
+                to=[user.email],
             ) # fmt: skip
+            message.attach_alternative(html_message, "text/html")
+            send_mail_messages([message])
 
             logger.info(f"Verification email sent successfully: {user.email}")
             return True
@@ -122,7 +212,15 @@ class EmailVerificationService:
     @staticmethod
     def verify_email_token(token: str):
         try:
-            verification_token = EmailVerificationToken.objects.get(token=token)
+            verification_token = (
+                EmailVerificationToken.objects.select_related("user")
+                .only(
+                    "is_used",
+                    "expires_at",
+                    *(f"user__{field}" for field in USER_PAYLOAD_FIELDS),
+                )
+                .get(token=bytes.fromhex(token.replace("-", "")))
+            )
             if not verification_token.is_valid():
                 return None, (
                     "Verification link has expired"
@@ -131,15 +229,15 @@ class EmailVerificationService:
                 )
 
             verification_token.is_used = True
-            verification_token.save()
+            verification_token.save(update_fields=["is_used"])
 
             user = verification_token.user
             user.mark_email_verified()
 
             logger.info(f"Email verfied successfully for user: {user.email}")
             return user, None
-        except EmailVerificationToken.DoesNotExist:
-            logger.warning(f"Invalid verification token {token} for {user.email}")
+        except (EmailVerificationToken.DoesNotExist, ValueError):
+            logger.warning(f"Invalid verification token {token}")
             return None, "Invalid verification token"
         except Exception as ex:
             logger.error(f"Email verification failed for token {token}: {str(ex)}")
@@ -150,17 +248,22 @@ class EmailVerificationService:
         if user.is_verified:
             return False, "Email is already verified"
 
-        recent_token = EmailVerificationToken.objects.filter(
-            user=user, created_at__gte=timezone.now() - timezone.timedelta(minutes=5)
-        ).count()
+        with transaction.atomic():
+            # serializes concurrent resends for the same user until commit
+            User.objects.select_for_update().only("id").get(pk=user.pk)
+            recent_token = EmailVerificationToken.objects.filter(
+                user=user,
+                created_at__gte=timezone.now() - timezone.timedelta(minutes=5),
+            ).count()
 
-        if recent_token >= 3:
-            message = """Too many verification emails sent. \
-                Please wait before requesting other"""
+            if recent_token >= 3:
+                message = """Too many verification emails sent. \
+                    Please wait before requesting other"""
 
-            return False, message
+                return False, message
 
-        if success := EmailVerificationService.send_verification_email(user):
-            return success, "Verification sent successfully to email"
+            # issued inside the lock so the next resend counts it
+            verification_token = EmailVerificationToken.objects.rotate(user)
+            queue_verification_email(user.id, verification_token.pk)
 
-        return False, "Failed to send verification email"
+        return True, "Verification sent successfully to email"
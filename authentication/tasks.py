@@ -0,0 +1,100 @@
+from django.db import connection, transaction
+from django.db.models import Case, F, Q, Value, When
+from django.utils import timezone
+from .models import User, EmailVerificationToken
+import threading
+import logging
+import atexit
+
+logger = logging.getLogger(__name__)
+
+# seconds a user status change waits in the buffer before the batched UPDATE
+USER_STATUS_FLUSH_INTERVAL = 10
+
+_pending_status = {}
+_pending_status_lock = threading.Lock()
+_flush_timer = None
+
+
+def send_verification_email_task(user_id, token_id=None):
+    """Re-fetch the user and send the verification email, for the given token if any"""
+    from .services import EmailVerificationService
+
+    try:
+        user = User.objects.get(pk=user_id)
+        token = None
+        if token_id is not None:
+            token = EmailVerificationToken.objects.get(pk=token_id, is_used=False)
+        return EmailVerificationService.send_verification_email(user, token)
+    except User.DoesNotExist:
+        logger.warning(f"Skipping verification email, user {user_id} not found")
+        return False
+    except EmailVerificationToken.DoesNotExist:
+        logger.info(f"Skipping verification email, token {token_id} was superseded")
+        return False
+    finally:
+        connection.close()
+
+
+def queue_verification_email(user_id, token_id=None):
+    """Send the verification email off the request thread once the transaction commits"""
+
+    def start():
+        threading.Thread(
+            target=send_verification_email_task, args=(user_id, token_id), daemon=True
+        ).start()
+
+    transaction.on_commit(start)
+
+
+def flush_user_status_task():
+    """Write every buffered user status in a single bulk UPDATE"""
+    global _flush_timer
+
+    with _pending_status_lock:
+        pending = _pending_status.copy()
+        _pending_status.clear()
+        _flush_timer = None
+
+    if not pending:
+        return 0
+
+    # a status another process wrote after ours wins, and updated_at only moves forward
+    flushed_at = timezone.now()
+    users = []
+    for user_id, (is_online, last_seen) in pending.items():
+        newer = Q(last_seen__gt=last_seen)
+        users.append(
+            User(
+                pk=user_id,
+                is_online=Case(When(newer, then=F("is_online")), default=Value(is_online)),
+                last_seen=Case(When(newer, then=F("last_seen")), default=Value(last_seen)),
+                updated_at=Case(When(newer, then=F("updated_at")), default=Value(flushed_at)),
+            ) # fmt: skip
+        )
+    try:
+        User.objects.bulk_update(users, ["is_online", "last_seen", "updated_at"])
+        logger.debug(f"Flushed status for {len(users)} users")
+        return len(users)
+    except Exception as ex:
+        logger.error(f"Failed to flush user status for {len(users)} users : {str(ex)}")
+        return 0
+    finally:
+        connection.close()
+
+
+def buffer_user_status(user_id, is_online, last_seen):
+    """Queue a status change for the next flush, starting the flush timer if idle"""
+    global _flush_timer
+
+    with _pending_status_lock:
+        _pending_status[user_id] = (is_online, last_seen)
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(
+                USER_STATUS_FLUSH_INTERVAL, flush_user_status_task
+            )
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+atexit.register(flush_user_status_task)
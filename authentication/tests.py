@@ -1,3 +1,45 @@
+from django.core.cache import cache
 from django.test import TestCase
+from django.utils import timezone
+from .models import User
+from .services import AuthenticationService
+from .tasks import buffer_user_status, flush_user_status_task
 
-# Create your tests here.
+
+class FlushUserStatusTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="patient@example.com", password="secret",
+            first_name="Test", last_name="Patient",
+        ) # fmt: skip
+
+    def tearDown(self):
+        flush_user_status_task()
+
+    def test_flush_after_verification_does_not_serve_stale_payload(self):
+        logged_in_at = timezone.now()
+        buffer_user_status(self.user.pk, True, logged_in_at)
+        AuthenticationService.serialize_user(User.objects.get(pk=self.user.pk))
+
+        self.user.mark_email_verified()
+        flush_user_status_task()
+
+        user = User.objects.get(pk=self.user.pk)
+        self.assertTrue(user.is_online)
+        self.assertGreaterEqual(user.updated_at, self.user.updated_at)
+        self.assertTrue(AuthenticationService.serialize_user(user)["is_verified"])
+
+    def test_flush_keeps_newer_status_written_elsewhere(self):
+        logged_in_at = timezone.now()
+        buffer_user_status(self.user.pk, True, logged_in_at)
+
+        logged_out_at = logged_in_at + timezone.timedelta(seconds=5)
+        User.objects.filter(pk=self.user.pk).update(
+            is_online=False, last_seen=logged_out_at, updated_at=logged_out_at
+        )
+        flush_user_status_task()
+
+        user = User.objects.get(pk=self.user.pk)
+        self.assertFalse(user.is_online)
+        self.assertEqual(user.last_seen, logged_out_at)
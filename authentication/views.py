@@ -5,11 +5,16 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError, InvalidToken
 from django.contrib.auth import get_user_model
-from .services import AuthenticationService, EmailVerificationService
+from django.utils import timezone
+from .services import (
+    AuthenticationService,
+    EmailVerificationService,
+    USER_PAYLOAD_FIELDS,
+)
+from .tasks import queue_verification_email
 from .serializers import (
     UserRegistrationSerializer,
     UserLoginSerializer,
-    UserSerializer,
     ResendVerificationSerializer,
     EmailVerificationSerializer,
 )
@@ -32,33 +37,23 @@ def register(request):
         )
 
         if user:
-            EmailVerificationService.send_verification_email(user)
+            queue_verification_email(user.id)
 
-            auth_data, auth_error = AuthenticationService.authenticate_user(
-                email=serializer.validated_data["email"],
-                password=serializer.validated_data["password"],
+            access_token, refresh_token = AuthenticationService.issue_tokens(user)
+            user.is_online = True
+            user.last_seen = user.updated_at = timezone.now()
+            User.objects.filter(pk=user.pk).update(
+                is_online=True, last_seen=user.last_seen, updated_at=user.updated_at
+            )
+            return Response(
+                {
+                    "message": "User registered successfully. Please check your email to verify your account",
+                    "user": AuthenticationService.serialize_user(user),
+                    "access_token": access_token,
+                    "refresh_token": refresh_token,
+                },
+                status=status.HTTP_201_CREATED,
             )
-
-            if auth_data:
-                AuthenticationService.update_user_status(
-                    auth_data["user"], is_online=True
-                )
-                return Response(
-                    {
-                        "message": "User registered successfully. Please check your email to verify your account",
-                        "user": UserSerializer(auth_data["user"]).data,
-                        "access_token": auth_data["access_token"],
-                        "refresh_token": auth_data["refresh_token"],
-                    },
-                    status=status.HTTP_201_CREATED,
-                )
-            else:
-                return Response(
-                    {
-                        "error": f"registered successfully, but login failed with {auth_error}"
-                    },
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                )
         else:
             return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -81,7 +76,7 @@ def login(request):
             return Response(
                 {
                     "message": "Login Successfully",
-                    "user": UserSerializer(auth_data["user"]).data,
+                    "user": AuthenticationService.serialize_user(auth_data["user"]),
                     "access_token": auth_data["access_token"],
                     "refresh_token": auth_data["refresh_token"],
                 },
@@ -121,7 +116,7 @@ def validate_token(request):
         return Response(
             {
                 "valid": True,
-                "user": UserSerializer(request.user).data,
+                "user": AuthenticationService.serialize_user(request.user),
                 "message": "Token is valid",
             },
             status=status.HTTP_200_OK,
@@ -140,7 +135,7 @@ def validate_token(request):
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def user_profile(request):
-    user = UserSerializer(request.user).data
+    user = AuthenticationService.serialize_user(request.user)
     return Response({"user": user}, status=status.HTTP_200_OK)
 
 
@@ -158,11 +153,14 @@ def token_refresh_custom(request):
         refresh = RefreshToken(refresh_token)
         access_token = str(refresh.access_token)
         user_id = refresh.payload.get("user_id")
-        user = User.objects.get(id=user_id)
+        user = User.objects.only(*USER_PAYLOAD_FIELDS).get(id=user_id)
 
         AuthenticationService.update_user_status(user, is_online=True)
         return Response(
-            {"access_token": access_token, "user": UserSerializer(user).data},
+            {
+                "access_token": access_token,
+                "user": AuthenticationService.serialize_user(user),
+            },
             status=status.HTTP_200_OK,
         )
 
@@ -187,7 +185,7 @@ def verify_email(request):
             return Response(
                 {
                     "message": "email verified successfully",
-                    "user": UserSerializer(user).data,
+                    "user": AuthenticationService.serialize_user(user),
                     "verified": True,
                 },
                 status=status.HTTP_200_OK,
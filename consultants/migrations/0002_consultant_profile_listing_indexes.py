@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultants', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='consultantprofile',
+            index=models.Index(fields=['speciality', 'is_verified', 'is_available', '-rating'], name='cp_spec_verified_avail_rating'),
+        ),
+        migrations.AddIndex(
+            model_name='consultantprofile',
+            index=models.Index(condition=models.Q(('is_available', True), ('is_verified', True)), fields=['is_featured', '-rating'], name='cp_featured_partial'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultants', '0002_consultant_profile_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='consultantprofile',
+            name='availablity_schedule',
+        ),
+        migrations.AddIndex(
+            model_name='consultantavailability',
+            index=models.Index(fields=['day_of_week', 'is_active', 'start_time', 'end_time'], name='consultant__day_of__c40b3b_idx'),
+        ),
+    ]
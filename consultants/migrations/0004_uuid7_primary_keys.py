@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:47
+
+import telehealth.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultants', '0003_consultant_availability_replaces_schedule_json'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='consultantavailability',
+            name='id',
+            field=models.UUIDField(default=telehealth.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='consultantprofile',
+            name='id',
+            field=models.UUIDField(default=telehealth.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='consultantreview',
+            name='id',
+            field=models.UUIDField(default=telehealth.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:47
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultants', '0005_consultant_review_rating_labels'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='consultantprofile',
+            name='consultant__user_id_ea9b3e_idx',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultants', '0006_remove_redundant_user_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='consultantavailability',
+            name='day_of_week',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'Monday'), (1, 'Tuesday'), (2, 'Wednesday'), (3, 'Thursday'), (4, 'Friday'), (5, 'Saturday'), (6, 'Sunday')]),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:50
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultants', '0007_consultant_availability_day_of_week_small_int'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='consultantavailability',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='consultantreview',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='speciality',
+            options={'verbose_name_plural': 'Specialties'},
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:51
+
+from django.db import migrations, models
+
+
+def backfill_rating_totals(apps, schema_editor):
+    ConsultantProfile = apps.get_model('consultants', 'ConsultantProfile')
+    ConsultantReview = apps.get_model('consultants', 'ConsultantReview')
+    totals = (
+        ConsultantReview.objects.order_by()
+        .values('consultant_id')
+        .annotate(total=models.Sum('rating'), count=models.Count('id'), avg=models.Avg('rating'))
+    )
+
+    ConsultantProfile.objects.update(rating_sum=0, total_reviews=0, rating=0)
+    for row in totals:
+        ConsultantProfile.objects.filter(id=row['consultant_id']).update(
+            rating_sum=row['total'], total_reviews=row['count'], rating=round(row['avg'], 2)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultants', '0008_drop_default_ordering'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='consultantprofile',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_rating_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:52
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultants', '0009_consultant_profile_rating_sum'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='consultantprofile',
+            name='consultant__created_57f7b1_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='consultantreview',
+            name='consultant__created_0e54a8_idx',
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultants', '0010_remove_created_at_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='consultantprofile',
+            name='license_number',
+            field=models.CharField(blank=True, max_length=100, null=True, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='consultantprofile',
+            name='speciality',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='consultant_speciality', to='consultants.speciality'),
+        ),
+    ]
@@ -1,12 +1,35 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import (
+    Avg,
+    Case,
+    Count,
+    F,
+    FloatField,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Coalesce, Concat, Now, NullIf, Round
 from django.contrib.auth import get_user_model
-from django.core.validators import MinValueValidator, MaxValueValidator, RegexValidator
-from django.utils import timezone
+from django.core.exceptions import ValidationError
+from django.core.validators import MinValueValidator, MaxValueValidator
 from calendar import day_name
-import uuid
+from functools import cached_property
+from telehealth.utils import phone_validator, uuid7
 
 User = get_user_model()
 
+CONSULTATION_TYPE_CHOICES = (
+    ("video", "Video Consultation"),
+    ("audio", "Audio Only"),
+    ("chat", "Text Chat"),
+    ("all", "All Types"),
+)
+RATING_CHOICES = tuple((i, f"{i} Star{'s' if i > 1 else ''}") for i in range(1, 6))
+DAY_CHOICES = tuple(enumerate(day_name))
+
 
 class Speciality(models.Model):
     """Medical Speciality"""
@@ -23,46 +46,127 @@ class Speciality(models.Model):
     class Meta:
         db_table = "specialties"
         verbose_name_plural = "Specialties"
-        ordering = ["name"]
+
+
+class ConsultantProfileQuerySet(models.QuerySet):
+    def with_display(self):
+        """Annotate the __str__ label so listing consultants skips the FK fetches"""
+        speciality_label = Case(
+            When(speciality__isnull=True, then=Value("")),
+            default=Concat(Value(" - "), "speciality__name"),
+            output_field=models.CharField(),
+        )
+        return self.annotate(
+            display_name=Concat(
+                Value("Dr. "), "user__first_name", Value(" "), "user__last_name",
+                speciality_label,
+                output_field=models.CharField(),
+            ) # fmt: skip
+        )
+
+    def with_rating_avg(self):
+        """Annotate every consultant's review average in one grouped join"""
+        return self.annotate(rating_avg=Avg("reviews__rating"))
+
+    def for_listing(self):
+        """Only the columns a consultant list renders, leaving bio and JSON lists unread"""
+        return self.only(
+            "id", "user", "speciality", "avatar", "rating", "total_reviews",
+            "is_verified", "is_available", "consultation_fee",
+        ) # fmt: skip
+
+
+class ConsultantProfileManager(models.Manager.from_queryset(ConsultantProfileQuerySet)):
+    def apply_review_delta(self, consultant_id, rating_delta, review_delta):
+        """Fold a review change into the running rating sum and count in one UPDATE"""
+        rating_sum = F("rating_sum") + rating_delta
+        total_reviews = F("total_reviews") + review_delta
+        return self.filter(id=consultant_id).update(
+            rating_sum=rating_sum,
+            total_reviews=total_reviews,
+            rating=Coalesce(
+                Round(Cast(rating_sum, FloatField()) / NullIf(total_reviews, 0), 2),
+                Value(0.0),
+            ),
+        )
+
+    def apply_review_change(self, stored, written):
+        """Move a review's (consultant_id, rating) from its stored to its written
+        value in the running totals, either side None for an insert or delete
+        """
+        if stored == written:
+            return
+        if stored and written and stored[0] == written[0]:
+            self.apply_review_delta(written[0], written[1] - stored[1], 0)
+            return
+        if stored:
+            self.apply_review_delta(stored[0], -stored[1], -1)
+        if written:
+            self.apply_review_delta(written[0], written[1], 1)
+
+    def bulk_recompute_ratings(self, consultant_ids):
+        """Rebuild rating sum, count and average from the reviews table in one UPDATE,
+        for writes that send no signals such as queryset update() and bulk_create()
+        """
+        reviews = (
+            ConsultantReview.objects.filter(consultant=OuterRef("pk"))
+            .order_by()
+            .values("consultant")
+        )
+        return self.filter(id__in=consultant_ids).update(
+            rating_sum=Coalesce(
+                Subquery(reviews.annotate(total=Sum("rating")).values("total")),
+                Value(0),
+            ),
+            total_reviews=Coalesce(
+                Subquery(reviews.annotate(count=Count("pk")).values("count")),
+                Value(0),
+            ),
+            rating=Coalesce(
+                Round(Subquery(reviews.annotate(avg=Avg("rating")).values("avg")), 2),
+                Value(0),
+            ),
+        )
+
+    def bulk_verify(self, consultant_ids):
+        """Verify consultants in a single UPDATE stamped with the database clock"""
+        return self.filter(id__in=consultant_ids).update(
+            is_verified=True, verification_date=Now()
+        )
 
 
 class ConsultantProfile(models.Model):
     """Consultant profile info"""
 
-    CONSULTATION_TYPE_CHOICES = [
-        ("video", "Video Consultation"),
-        ("audio", "Audio Only"),
-        ("chat", "Text Chat"),
-        ("all", "All Types"),
-    ]
-
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.OneToOneField(
         User,
         on_delete=models.CASCADE,
         related_name="consultant_profile",
         limit_choices_to={"role": "consultant"},
     )
+    # filled in by the consultant after the profile is created at registration
     speciality = models.ForeignKey(
-        Speciality, on_delete=models.PROTECT, related_name="consultant_speciality"
+        Speciality,
+        on_delete=models.PROTECT,
+        related_name="consultant_speciality",
+        blank=True,
+        null=True,
     )
     avatar = models.ImageField(upload_to="consultants/avatar/", blank=True, null=True)
     bio = models.TextField(max_length=1000, blank=True)
     years_of_experience = models.PositiveIntegerField(
         default=0, validators=[MaxValueValidator(50)]
     )
-    license_number = models.CharField(max_length=100, unique=True)
+    license_number = models.CharField(
+        max_length=100, unique=True, blank=True, null=True
+    )
     medical_degree = models.CharField(max_length=200, blank=True)
     board_certifications = models.JSONField(default=list, blank=True)
     additional_qualification = models.JSONField(default=list, blank=True)
 
-    phone_regex = RegexValidator(
-        regex=r"^\+?91?\d{9,15}$",
-        message="Phone number must use the format: +91-[10 digit number]",
-    )
-
     phone_number = models.CharField(
-        validators=[phone_regex], max_length=17, blank=False
+        validators=[phone_validator], max_length=17, blank=False
     )
     clinic_name = models.CharField(max_length=200, blank=True)
     clinic_address = models.TextField(max_length=300, blank=True)
@@ -81,9 +185,6 @@ class ConsultantProfile(models.Model):
     )
     language_spoken = models.JSONField(default=list, blank=True)
     is_available = models.BooleanField(default=True)
-    availablity_schedule = models.JSONField(
-        default=dict, blank=True, help_text="Weekly schedule with time slots"
-    )
     rating = models.DecimalField(
         max_digits=3,
         decimal_places=2,
@@ -92,39 +193,48 @@ class ConsultantProfile(models.Model):
     )
     total_consultations = models.PositiveIntegerField(default=0)
     total_reviews = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
     is_verified = models.BooleanField(default=False)
     verification_date = models.DateTimeField(blank=True, null=True)
     is_featured = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ConsultantProfileManager()
+
     def __str__(self):
+        if display_name := getattr(self, "display_name", None):
+            return display_name
+        if self.speciality_id is None:
+            return f"Dr. {self.user.full_name}"
         return f"Dr. {self.user.full_name} - {self.speciality.name}"
 
-    @property
+    @cached_property
     def avatar_url(self):
-        if avatar := self.avatar:
-            return avatar.url
-        return None
+        return self.avatar.url if self.avatar else None
 
     def verify_consultant(self):
         """Mark consultant as verified"""
+        type(self).objects.bulk_verify([self.pk])
         self.is_verified = True
-        self.verification_date = timezone.now().date()
-        self.save(update_fields=["is_verified", "verification_date"])
-
-    def update_rating(self):
-        """update rating"""
-        from django.db.models import Avg
-
-        if avg_rating := self.reviews.aggregate(Avg("rating"))["rating_avg"]:
-            self.rating = round(avg_rating, 2)
-            self.save(update_fields=["rating"])
+        # set by the database, reloaded from the row on next access
+        self.__dict__.pop("verification_date", None)
+
+    def update_rating(self, avg_rating=None):
+        """update rating, from a precomputed average when the caller has one,
+        otherwise rebuild rating, sum and count from the reviews"""
+        if avg_rating is None:
+            type(self).objects.bulk_recompute_ratings([self.pk])
+            # set by the database, reloaded from the row on next access
+            for field in ("rating", "rating_sum", "total_reviews"):
+                self.__dict__.pop(field, None)
+            return
+
+        self.rating = round(avg_rating, 2)
+        type(self).objects.filter(pk=self.pk).update(rating=self.rating)
 
     def clean(self):
         if self.user and self.user.role != "consultant":
-            from django.core.exceptions import ValidationError
-
             raise ValidationError("User must have a consultant role")
 
     class Meta:
@@ -132,20 +242,30 @@ class ConsultantProfile(models.Model):
         verbose_name = "Consultant Profile"
         verbose_name_plural = "Consultant Profiles"
         indexes = [
-            models.Index(fields=["user"]),
             models.Index(fields=["speciality"]),
             models.Index(fields=["is_verified", "is_available"]),
-            models.Index(fields=["created_at"]),
             models.Index(fields=["rating"]),
+            models.Index(
+                fields=["speciality", "is_verified", "is_available", "-rating"],
+                name="cp_spec_verified_avail_rating",
+            ),
+            models.Index(
+                fields=["is_featured", "-rating"],
+                condition=models.Q(is_available=True, is_verified=True),
+                name="cp_featured_partial",
+            ),
         ]
 
 
+class ConsultantReviewManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related("consultant__user", "patient")
+
+
 class ConsultantReview(models.Model):
     """Reviews and Ratings"""
 
-    RATING_CHOICES = [(i, f"{i} Star{'s' if i < 1 else ''}") for i in range(1, 6)]
-
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     consultant = models.ForeignKey(
         ConsultantProfile, on_delete=models.CASCADE, related_name="reviews"
     )
@@ -159,48 +279,100 @@ class ConsultantReview(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ConsultantReviewManager()
+
     def __str__(self):
         patient_name = "Anonymous" if self.is_anonymous else self.patient.full_name
-        return f"{patient_name} -> Dr. {self.consultant.full_name} ({self.rating} *)"
+        return (
+            f"{patient_name} -> Dr. {self.consultant.user.full_name} ({self.rating} *)"
+        )
+
+    def lock_stored_rating(self):
+        """Lock this review's row and return its stored (consultant_id, rating)"""
+        return (
+            type(self)
+            .objects.select_for_update()
+            .filter(pk=self.pk)
+            .values_list("consultant_id", "rating")
+            .first()
+        )
 
     def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
-        self.consultant.update_rating()
+        # the rating totals are moved by the post_save receiver in this transaction
+        with transaction.atomic():
+            self._stored_rating = (
+                None if self._state.adding else self.lock_stored_rating()
+            )
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            self._stored_rating = self.lock_stored_rating()
+            return super().delete(*args, **kwargs)
 
     class Meta:
         db_table = "consultant_review"
         unique_together = ["consultant", "patient"]
-        ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["consultant", "rating"]),
-            models.Index(fields=["created_at"]),
         ]
 
 
+class ConsultantAvailabilityQuerySet(models.QuerySet):
+    def available_at(self, day_of_week, at_time):
+        """Active slots covering the given weekday and time, with consultant joined"""
+        return (
+            self.filter(
+                day_of_week=day_of_week,
+                is_active=True,
+                start_time__lte=at_time,
+                end_time__gt=at_time,
+            )
+            .select_related("consultant__user", "consultant__speciality")
+            .order_by("start_time")
+        )
+
+
+class ConsultantAvailabilityManager(
+    models.Manager.from_queryset(ConsultantAvailabilityQuerySet)
+):
+    def bulk_upsert(self, slots, batch_size=1000):
+        """Insert slots in batches, updating end time and status of existing ones"""
+        return self.bulk_create(
+            slots,
+            batch_size=batch_size,
+            update_conflicts=True,
+            update_fields=["end_time", "is_active", "updated_at"],
+            unique_fields=["consultant", "day_of_week", "start_time"],
+        )
+
+
 class ConsultantAvailability(models.Model):
     """available time of consultant"""
 
-    DAY_CHOICES = list((i, day) for i, day in enumerate(day_name))
-
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     consultant = models.ForeignKey(
         ConsultantProfile, on_delete=models.CASCADE, related_name="available_slots"
     )
-    day_of_week = models.IntegerField(choices=DAY_CHOICES)
+    day_of_week = models.PositiveSmallIntegerField(choices=DAY_CHOICES)
     start_time = models.TimeField()
     end_time = models.TimeField()
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ConsultantAvailabilityManager()
+
     def __str__(self):
         return f"Dr. {self.consultant.user.full_name} - {self.get_day_of_the_week_display} {self.start_time} - {self.end_time}"
 
     @property
     def get_day_of_the_week_display(self):
-        return self.DAY_CHOICES[self.day_of_week]
+        return day_name[self.day_of_week]
 
     class Meta:
         db_table = "consultant_availability"
         unique_together = ["consultant", "day_of_week", "start_time"]
-        ordering = ["day_of_week", "start_time"]
+        indexes = [
+            models.Index(fields=["day_of_week", "is_active", "start_time", "end_time"]),
+        ]
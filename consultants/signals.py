@@ -0,0 +1,30 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import ConsultantProfile, ConsultantReview
+
+
+@receiver(post_save, sender=ConsultantReview)
+def apply_saved_review_rating(sender, instance, created, update_fields, **kwargs):
+    stored = instance.__dict__.pop("_stored_rating", None)
+    if not created and stored is None:
+        # raw fixture loads bypass save(), reconcile with bulk_recompute_ratings()
+        return
+
+    consultant_id, rating = instance.consultant_id, instance.rating
+    if stored and update_fields is not None:
+        if not {"consultant", "consultant_id"} & update_fields:
+            consultant_id = stored[0]
+        if "rating" not in update_fields:
+            rating = stored[1]
+
+    ConsultantProfile.objects.apply_review_change(stored, (consultant_id, rating))
+
+
+@receiver(post_delete, sender=ConsultantReview)
+def apply_deleted_review_rating(sender, instance, **kwargs):
+    # cascaded deletes never call ConsultantReview.delete(), their rows come fresh
+    stored = instance.__dict__.pop("_stored_rating", None) or (
+        instance.consultant_id,
+        instance.rating,
+    )
+    ConsultantProfile.objects.apply_review_change(stored, None)
@@ -1,3 +1,114 @@
+from decimal import Decimal
 from django.test import TestCase
+from authentication.models import User
+from .models import ConsultantProfile, ConsultantReview
 
-# Create your tests here.
+
+class VerifyConsultantTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            email="consultant@example.com", password="secret",
+            first_name="Test", last_name="Consultant", role="consultant",
+        ) # fmt: skip
+        self.profile = user.consultant_profile
+
+    def test_verify_twice_on_same_instance(self):
+        self.profile.verify_consultant()
+        self.profile.verify_consultant()
+
+        self.assertTrue(self.profile.is_verified)
+        self.assertIsNotNone(self.profile.verification_date)
+
+    def test_verify_listing_instance(self):
+        profile = ConsultantProfile.objects.for_listing().get(pk=self.profile.pk)
+        profile.verify_consultant()
+
+        self.assertTrue(profile.is_verified)
+        self.assertIsNotNone(profile.verification_date)
+        self.assertTrue(ConsultantProfile.objects.get(pk=profile.pk).is_verified)
+
+
+def create_user(email, role):
+    return User.objects.create_user(
+        email=email, password="secret",
+        first_name="Test", last_name=role.title(), role=role,
+    ) # fmt: skip
+
+
+class ReviewRatingTests(TestCase):
+    def setUp(self):
+        self.consultant = create_user("consultant@example.com", "consultant")
+        self.other = create_user("other@example.com", "consultant")
+        self.patients = [
+            create_user(f"patient{i}@example.com", "patient") for i in range(2)
+        ]
+
+    def review(self, rating, patient=0, consultant=None):
+        return ConsultantReview.objects.create(
+            consultant=(consultant or self.consultant).consultant_profile,
+            patient=self.patients[patient],
+            rating=rating,
+        )
+
+    def assertTotals(self, user, rating_sum, total_reviews, rating):
+        profile = ConsultantProfile.objects.get(user=user)
+        self.assertEqual(
+            (profile.rating_sum, profile.total_reviews, profile.rating),
+            (rating_sum, total_reviews, Decimal(rating)),
+        )
+
+    def test_create(self):
+        self.review(5)
+        self.review(2, patient=1)
+        self.assertTotals(self.consultant, 7, 2, "3.50")
+
+    def test_edit(self):
+        review = self.review(3)
+        review.rating = 5
+        review.save()
+        self.assertTotals(self.consultant, 5, 1, "5.00")
+
+    def test_move_to_other_consultant(self):
+        review = self.review(4)
+        review.consultant = self.other.consultant_profile
+        review.save()
+        self.assertTotals(self.consultant, 0, 0, "0.00")
+        self.assertTotals(self.other, 4, 1, "4.00")
+
+    def test_delete(self):
+        review = self.review(4)
+        self.review(2, patient=1)
+        review.delete()
+        self.assertTotals(self.consultant, 2, 1, "2.00")
+
+    def test_cascaded_patient_delete(self):
+        self.review(4)
+        self.review(3, patient=1)
+        self.patients[0].delete()
+        self.assertTotals(self.consultant, 3, 1, "3.00")
+
+    def test_stale_instances(self):
+        review = self.review(3)
+        first = ConsultantReview.objects.get(pk=review.pk)
+        second = ConsultantReview.objects.get(pk=review.pk)
+        first.rating = 5
+        first.save()
+        second.rating = 4
+        second.save()
+        self.assertTotals(self.consultant, 4, 1, "4.00")
+
+    def test_update_fields_without_rating(self):
+        review = self.review(3)
+        review.rating = 5
+        review.review_text = "Helpful"
+        review.save(update_fields=["review_text"])
+        self.assertTotals(self.consultant, 3, 1, "3.00")
+
+    def test_update_rating_without_reviews(self):
+        profile = self.consultant.consultant_profile
+        ConsultantProfile.objects.filter(pk=profile.pk).update(
+            rating=4, rating_sum=4, total_reviews=1
+        )
+        profile.update_rating()
+        self.assertEqual(profile.rating, Decimal("0.00"))
+        self.assertTotals(self.consultant, 0, 0, "0.00")
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='patientprofile',
+            index=models.Index(fields=['date_of_birth'], name='patient_pro_date_of_03ba04_idx'),
+        ),
+    ]
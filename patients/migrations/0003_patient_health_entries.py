@@ -0,0 +1,64 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:46
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+HEALTH_ENTRY_FIELDS = {
+    'allergy': 'allergies',
+    'cronic_condition': 'cronic_conditions',
+    'current_medication': 'current_medications',
+}
+
+
+def copy_json_lists(apps, schema_editor):
+    PatientProfile = apps.get_model('patients', 'PatientProfile')
+    PatientHealthEntry = apps.get_model('patients', 'PatientHealthEntry')
+
+    entries = []
+    for profile in PatientProfile.objects.only('id', *HEALTH_ENTRY_FIELDS.values()).iterator():
+        for kind, field in HEALTH_ENTRY_FIELDS.items():
+            names = {str(name).strip()[:100] for name in getattr(profile, field) or []}
+            entries += [PatientHealthEntry(patient_id=profile.id, kind=kind, name=name) for name in names if name]
+
+    PatientHealthEntry.objects.bulk_create(entries, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0002_patient_profile_date_of_birth_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PatientHealthEntry',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('allergy', 'Allergy'), ('cronic_condition', 'Cronic Condition'), ('current_medication', 'Current Medication')], max_length=20)),
+                ('name', models.CharField(max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('patient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='health_entries', to='patients.patientprofile')),
+            ],
+            options={
+                'verbose_name_plural': 'Patient Health Entries',
+                'db_table': 'patient_health_entries',
+                'indexes': [models.Index(fields=['kind', 'name'], name='patient_hea_kind_122f3c_idx')],
+                'unique_together': {('patient', 'kind', 'name')},
+            },
+        ),
+        migrations.RunPython(copy_json_lists, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='patientprofile',
+            name='allergies',
+        ),
+        migrations.RemoveField(
+            model_name='patientprofile',
+            name='cronic_conditions',
+        ),
+        migrations.RemoveField(
+            model_name='patientprofile',
+            name='current_medications',
+        ),
+    ]
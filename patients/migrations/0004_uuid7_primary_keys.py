@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:47
+
+import telehealth.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0003_patient_health_entries'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='patienthealthentry',
+            name='id',
+            field=models.UUIDField(default=telehealth.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='patientmedicalhistory',
+            name='id',
+            field=models.UUIDField(default=telehealth.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='patientprofile',
+            name='id',
+            field=models.UUIDField(default=telehealth.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
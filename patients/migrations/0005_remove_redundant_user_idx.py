@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:47
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0004_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='patientprofile',
+            name='patient_pro_user_id_27548b_idx',
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:50
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0005_remove_redundant_user_idx'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='patientmedicalhistory',
+            options={},
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:52
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0006_drop_default_ordering'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='patientprofile',
+            name='patient_pro_created_2ba952_idx',
+        ),
+    ]
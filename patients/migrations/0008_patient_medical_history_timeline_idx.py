@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 20:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patients', '0007_remove_created_at_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='patientmedicalhistory',
+            index=models.Index(fields=['patient', '-date_occured', '-created_at'], name='patient_med_patient_416caf_idx'),
+        ),
+    ]
@@ -1,12 +1,54 @@
 from django.db import models
 from django.contrib.auth import get_user_model
-from django.core.validators import RegexValidator
+from django.core.exceptions import ValidationError
 from django.utils import timezone
-import uuid
+from datetime import datetime, time, timedelta
+from functools import cached_property
+from telehealth.utils import phone_validator, uuid7
 
 User = get_user_model()
 
 
+def years_before(day, years):
+    """Same calendar day `years` earlier, with 29 Feb falling back to 28 Feb"""
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        return day.replace(year=day.year - years, day=28)
+
+
+class PatientProfileQuerySet(models.QuerySet):
+    def with_age_between(self, min_age=None, max_age=None):
+        """Filter by age as date_of_birth bounds, so the date_of_birth index is used"""
+        today = timezone.localdate()
+
+        def start_of_day_after(day):
+            return timezone.make_aware(
+                datetime.combine(day + timedelta(days=1), time.min)
+            )
+
+        queryset = self
+        if min_age is not None:
+            queryset = queryset.filter(
+                date_of_birth__lt=start_of_day_after(years_before(today, min_age))
+            )
+        if max_age is not None:
+            queryset = queryset.filter(
+                date_of_birth__gte=start_of_day_after(years_before(today, max_age + 1))
+            )
+        return queryset
+
+    def with_health_entry(self, kind, name):
+        """Patients with the given allergy, cronic condition or current medication"""
+        return self.filter(health_entries__kind=kind, health_entries__name=name)
+
+    def for_listing(self):
+        """Only the columns a patient list renders, leaving notes and address unread"""
+        return self.only(
+            "id", "user", "avatar", "date_of_birth", "gender", "city", "blood_type"
+        )
+
+
 class PatientProfile(models.Model):
     """Patient profile info"""
 
@@ -28,7 +70,7 @@ class PatientProfile(models.Model):
         ("unknown", "Unknown"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.OneToOneField(
         User,
         on_delete=models.CASCADE,
@@ -40,31 +82,19 @@ class PatientProfile(models.Model):
     date_of_birth = models.DateTimeField(blank=True, null=True)
     gender = models.CharField(max_length=20, choices=GENDER_CHOICES, blank=True)
 
-    phone_regex = RegexValidator(
-        regex=r"^\+?91?\d{9,15}$",
-        message="Phone number must use the format: +91-[10 digit number]",
+    phone_number = models.CharField(
+        validators=[phone_validator], max_length=17, blank=True
     )
-
-    phone_number = models.CharField(validators=[phone_regex], max_length=17, blank=True)
     address = models.TextField(max_length=300, blank=True)
     city = models.CharField(max_length=100, blank=True)
     country = models.CharField(max_length=100, blank=True)
     postal_code = models.CharField(max_length=20, blank=True)
     emergency_contact_name = models.CharField(max_length=100, blank=True)
     emergency_contact_phone = models.CharField(
-        validators=[phone_regex], max_length=17, blank=True
+        validators=[phone_validator], max_length=17, blank=True
     )
     emergency_contant_relationship = models.CharField(max_length=50, blank=True)
     blood_type = models.CharField(choices=BLOOD_TYPE_CHOICES, blank=False)
-    allergies = models.JSONField(
-        default=list, blank=True, help_text="List of allergies"
-    )
-    cronic_conditions = models.JSONField(
-        default=list, blank=True, help_text="List of cronic conditions"
-    )
-    current_medications = models.JSONField(
-        default=list, blank=True, help_text="List of current medications"
-    )
     medical_notes = models.TextField(
         blank=True, help_text="Additional medical information"
     )
@@ -75,37 +105,51 @@ class PatientProfile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = PatientProfileQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.user.full_name}"
 
-    @property
+    @cached_property
     def avatar_url(self):
-        if self.avatar:
-            return self.avatar_url
-        return None
+        return self.avatar.url if self.avatar else None
 
     @property
     def age(self):
         if dob := self.date_of_birth:
             today = timezone.now().date()
-            return today.year - dob.year - (today.month, today.day) < (
-                dob.month,
-                dob.day,
+            return (
+                today.year
+                - dob.year
+                - ((today.month, today.day) < (dob.month, dob.day))
             )
 
         return None
 
     def clean(self):
         if self.user and self.user.role != "patient":
-            from django.core.exceptions import ValidationError
-
             raise ValidationError("User must have a patient role")
 
     class Meta:
         db_table = "patient_profiles"
         verbose_name = "Patient Profile"
         verbose_name_plural = "Patient Profiles"
-        indexes = [models.Index(fields=["user"]), models.Index(fields=["created_at"])]
+        indexes = [
+            models.Index(fields=["date_of_birth"]),
+        ]
+
+
+class PatientMedicalHistoryManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related("patient__user")
+
+    def for_patient(self, patient):
+        """A patient's history, most recent first"""
+        return self.filter(patient=patient).order_by("-date_occured", "-created_at")
+
+    def bulk_import(self, records, batch_size=1000):
+        """Insert records in batches, skipping ones whose id already exists"""
+        return self.bulk_create(records, batch_size=batch_size, ignore_conflicts=True)
 
 
 class PatientMedicalHistory(models.Model):
@@ -121,7 +165,7 @@ class PatientMedicalHistory(models.Model):
         ("other", "Other"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     patient = models.ForeignKey(
         PatientProfile, on_delete=models.CASCADE, related_name="medical_history"
     )
@@ -135,9 +179,40 @@ class PatientMedicalHistory(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = PatientMedicalHistoryManager()
+
     def __str__(self):
         return f"{self.patient.user.full_name} - {self.title}"
 
     class Meta:
         db_table = "patient_medical_history"
-        ordering = ["-date_occured", "-created_at"]
+        indexes = [
+            models.Index(fields=["patient", "-date_occured", "-created_at"]),
+        ]
+
+
+class PatientHealthEntry(models.Model):
+    """Allergies, cronic conditions and current medications, one row per item"""
+
+    KIND_CHOICES = [
+        ("allergy", "Allergy"),
+        ("cronic_condition", "Cronic Condition"),
+        ("current_medication", "Current Medication"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    patient = models.ForeignKey(
+        PatientProfile, on_delete=models.CASCADE, related_name="health_entries"
+    )
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    name = models.CharField(max_length=100)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.name}"
+
+    class Meta:
+        db_table = "patient_health_entries"
+        verbose_name_plural = "Patient Health Entries"
+        unique_together = ["patient", "kind", "name"]
+        indexes = [models.Index(fields=["kind", "name"])]
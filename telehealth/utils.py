@@ -0,0 +1,19 @@
+from django.core.validators import RegexValidator
+import os
+import time
+import uuid
+
+
+def uuid7():
+    """Time-ordered UUID (RFC 9562 v7): 48-bit unix ms timestamp, then random bits"""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
+
+
+# shared by every phone number field, so the pattern is compiled once per process
+phone_validator = RegexValidator(
+    regex=r"^\+?91?\d{9,15}$",
+    message="Phone number must use the format: +91-[10 digit number]",
+)